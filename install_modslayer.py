@@ -1,65 +1,238 @@
 import sys
 import subprocess
+import shutil
 import os
 import platform
+import importlib.util
+import struct
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 REQUIRED_PYTHON = (3, 7)
+PYTHON_OK = sys.version_info >= REQUIRED_PYTHON
+IS_WINDOWS = platform.system() == "Windows"
+PYTHON_EXE = sys.executable
+# Resolved next to this installer so running it from another CWD still works
+SCRIPT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "mod_manager.py"))
 REQUIRED_PACKAGES = [
-    # Tkinter is included with Python, but pywin32 is needed for Windows shortcuts
-    "pywin32; platform_system=='Windows'"
+    # Tkinter is included with Python and the Windows shortcut is written
+    # directly, so nothing beyond the standard library is needed today
 ]
+# Persistent pip cache so re-runs reuse downloaded wheels. PIP_CACHE_DIR
+# takes precedence; CI jobs can cache this directory between runs.
+PIP_CACHE_DIR = os.environ.get("PIP_CACHE_DIR") or os.path.join(
+    os.path.expanduser("~"), ".cache", "modslayer-pip")
+# Optional hash-pinned lock file covering REQUIRED_PACKAGES; when present
+# it is installed with --require-hashes instead of the loose specs
+LOCK_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "requirements-lock.txt")
+# Module that is importable once each distribution is installed
+PROBE_MODULES = {}
+
+# Shell Link (.lnk) format constants, see [MS-SHLLINK]
+SHELL_LINK_CLSID = bytes.fromhex("0114020000000000c000000000000046")
+LINK_HAS_LINK_INFO = 0x02
+LINK_HAS_WORKING_DIR = 0x10
+LINK_HAS_ARGUMENTS = 0x20
+LINK_HAS_ICON_LOCATION = 0x40
+LINK_IS_UNICODE = 0x80
+LINK_INFO_VOLUME_ID_AND_LOCAL_BASE_PATH = 0x01
+DRIVE_FIXED = 3
 
 def check_python_version():
-    if sys.version_info < REQUIRED_PYTHON:
+    if not PYTHON_OK:
         print(f"Python {REQUIRED_PYTHON[0]}.{REQUIRED_PYTHON[1]} or newer is required.")
         sys.exit(1)
 
+def pip_args(packages):
+    return ["install", "--disable-pip-version-check", "--no-input",
+            "--cache-dir", PIP_CACHE_DIR, *packages]
+
 def pip_install(package):
+    # Separate pip process so several installs can run side by side
+    subprocess.check_call([sys.executable, "-m", "pip", *pip_args([package])])
+
+def pip_install_parallel(packages, workers):
+    with ThreadPoolExecutor(max_workers=min(len(packages), workers)) as pool:
+        futures = {pool.submit(pip_install, pkg): pkg for pkg in packages}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except (subprocess.CalledProcessError, OSError) as e:
+                print(f"Failed to install {futures[future]}: {e}")
+                sys.exit(1)
+
+def run_pip(packages):
+    uv = shutil.which("uv")
+    if uv:
+        # uv is a much faster drop-in and keeps its own cache
+        subprocess.check_call([uv, "pip", "install", "--python", PYTHON_EXE, *packages])
+    elif importlib.util.find_spec("pip._internal.cli.main") is not None:
+        # Run pip inside this interpreter to skip a second Python startup
+        from pip._internal.cli.main import main as pip_main
+        args = pip_args(packages)
+        rc = pip_main(args)
+        if rc != 0:
+            raise subprocess.CalledProcessError(rc, ["pip", *args])
+    else:
+        subprocess.check_call([sys.executable, "-m", "pip", *pip_args(packages)])
+
+def pip_install_many(packages):
+    # One pip run for the whole batch instead of one per package
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-    except Exception as e:
-        print(f"Failed to install {package}: {e}")
+        run_pip(packages)
+    except subprocess.CalledProcessError as e:
+        # Give a configured mirror one chance before giving up
+        mirror = os.environ.get("MODSLAYER_INDEX_URL")
+        if not mirror:
+            print(f"Failed to install {' '.join(packages)}: {e}")
+            sys.exit(1)
+        print(f"pip failed ({e}); retrying with index {mirror}")
+        try:
+            run_pip([*packages, "--index-url", mirror])
+        except subprocess.CalledProcessError as e:
+            print(f"Failed to install {' '.join(packages)}: {e}")
+            sys.exit(1)
+
+def is_installed(pkg):
+    name = pkg.split(";")[0].strip()
+    probe = PROBE_MODULES.get(name)
+    return probe is not None and importlib.util.find_spec(probe) is not None
+
+def all_satisfied():
+    return all(is_installed(pkg) for pkg in REQUIRED_PACKAGES)
+
+def check_pip():
+    if shutil.which("uv") is None and importlib.util.find_spec("pip") is None:
+        print("pip is not available for this Python. Install it with: python -m ensurepip")
         sys.exit(1)
 
 def install_requirements():
-    for pkg in REQUIRED_PACKAGES:
-        if "; platform_system=='Windows'" in pkg:
-            if platform.system() == "Windows":
-                pkg = pkg.split(";")[0]
-                pip_install(pkg)
-        else:
-            pip_install(pkg)
+    if os.path.exists(LOCK_FILE):
+        # Exact pins with hashes let pip install without resolving anything;
+        # the lock file is authoritative, so it is used even when
+        # REQUIRED_PACKAGES has nothing left to install
+        check_pip()
+        pip_install_many(["--require-hashes", "-r", LOCK_FILE])
+        return
+    # Specs are passed verbatim; pip evaluates PEP 508 markers itself
+    to_install = [pkg for pkg in REQUIRED_PACKAGES if not is_installed(pkg)]
+    if not to_install:
+        return
+    check_pip()
+    # MODSLAYER_PARALLEL=N installs packages one per pip process, N at a
+    # time, for requirement sets that can't be resolved as a single batch
+    parallel = os.environ.get("MODSLAYER_PARALLEL", "0")
+    try:
+        workers = int(parallel)
+    except ValueError:
+        print(f"MODSLAYER_PARALLEL must be a whole number of workers, not {parallel!r}.")
+        sys.exit(1)
+    if workers > 1 and len(to_install) > 1:
+        pip_install_parallel(to_install, workers)
+    else:
+        pip_install_many(to_install)
+
+def shell_link_bytes(target, arguments, working_dir, icon):
+    """Build an MS-SHLLINK (.lnk) file that runs target with arguments"""
+    flags = (LINK_HAS_LINK_INFO | LINK_HAS_WORKING_DIR | LINK_HAS_ARGUMENTS
+             | LINK_HAS_ICON_LOCATION | LINK_IS_UNICODE)
+    header = struct.pack(
+        "<I16sIIQQQIIIHHII",
+        0x4C, SHELL_LINK_CLSID, flags,
+        0,        # FileAttributes
+        0, 0, 0,  # creation, access and write times
+        0,        # FileSize
+        0,        # IconIndex
+        1,        # ShowCommand: SW_SHOWNORMAL
+        0, 0, 0, 0)
+
+    # LinkInfo: fixed-drive VolumeID plus ANSI and Unicode local base paths
+    volume_id = struct.pack("<IIII", 0x11, DRIVE_FIXED, 0, 0x10) + b"\0"
+    base_ansi = target.encode("mbcs" if IS_WINDOWS else "ascii", "replace") + b"\0"
+    base_unicode = target.encode("utf-16-le") + b"\0\0"
+    header_size = 0x24
+    base_offset = header_size + len(volume_id)
+    suffix_offset = base_offset + len(base_ansi)
+    base_unicode_offset = suffix_offset + 1
+    suffix_unicode_offset = base_unicode_offset + len(base_unicode)
+    link_info_size = suffix_unicode_offset + 2
+    link_info = struct.pack(
+        "<IIIIIIIII",
+        link_info_size, header_size, LINK_INFO_VOLUME_ID_AND_LOCAL_BASE_PATH,
+        header_size, base_offset, 0, suffix_offset,
+        base_unicode_offset, suffix_unicode_offset,
+    ) + volume_id + base_ansi + b"\0" + base_unicode + b"\0\0"
+
+    string_data = b""
+    for value in (working_dir, arguments, icon):
+        encoded = value.encode("utf-16-le")
+        string_data += struct.pack("<H", len(encoded) // 2) + encoded
+
+    return header + link_info + string_data + b"\0\0\0\0"
+
+@functools.lru_cache(maxsize=1)
+def desktop_dir():
+    # The registry knows about Desktop folders redirected to OneDrive etc.
+    try:
+        import winreg
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER,
+                            r"Software\Microsoft\Windows\CurrentVersion\Explorer\Shell Folders") as key:
+            return winreg.QueryValueEx(key, "Desktop")[0]
+    except (ImportError, OSError):
+        return os.path.join(os.path.expanduser("~"), 'Desktop')
+
+def shortcut_path():
+    return os.path.join(desktop_dir(), "ModSlayer.lnk")
+
+def shortcut_data():
+    return shell_link_bytes(PYTHON_EXE, f'"{SCRIPT_PATH}"',
+                            os.path.dirname(SCRIPT_PATH), SCRIPT_PATH)
+
+def shortcut_up_to_date(shortcut, data):
+    # A moved install or a new Python changes the bytes, so this also
+    # catches stale shortcuts, not just missing ones
+    try:
+        with open(shortcut, "rb") as f:
+            return f.read() == data
+    except OSError:
+        return False
 
 def create_windows_shortcut():
     try:
-        import win32com.client
-        desktop = os.path.join(os.path.join(os.environ['USERPROFILE']), 'Desktop')
-        shortcut = os.path.join(desktop, "ModSlayer.lnk")
-        target = sys.executable
-        script = os.path.abspath("mod_manager.py")
-        icon = script
-
-        shell = win32com.client.Dispatch("WScript.Shell")
-        shortcut_obj = shell.CreateShortCut(shortcut)
-        shortcut_obj.Targetpath = target
-        shortcut_obj.Arguments = f'"{script}"'
-        shortcut_obj.WorkingDirectory = os.path.dirname(script)
-        shortcut_obj.IconLocation = icon
-        shortcut_obj.save()
+        shortcut = shortcut_path()
+        data = shortcut_data()
+        if shortcut_up_to_date(shortcut, data):
+            print("Desktop shortcut already up to date: ModSlayer.lnk")
+            return
+
+        tmp_path = shortcut + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, shortcut)
         print("Desktop shortcut created: ModSlayer.lnk")
-    except Exception as e:
+    except OSError as e:
         print(f"Could not create desktop shortcut: {e}")
 
 def main():
     print("Checking Python version...")
     check_python_version()
+    # Only a re-run with packages or a shortcut to check can be skipped;
+    # a lock file always goes through pip, which checks the pins itself
+    has_work = bool(REQUIRED_PACKAGES) or IS_WINDOWS
+    if has_work and all_satisfied() and not os.path.exists(LOCK_FILE) and (
+            not IS_WINDOWS or shortcut_up_to_date(shortcut_path(), shortcut_data())):
+        # Re-run on a finished install: skip pip and the shortcut entirely
+        print("ModSlayer is already installed. Run it with:")
+        print("    python mod_manager.py")
+        return
+    os.makedirs(PIP_CACHE_DIR, exist_ok=True)
     print("Installing required packages...")
     install_requirements()
 
     print("\nInstallation complete!")
     print("To run ModSlayer, use:")
     print(f"    python mod_manager.py")
-    if platform.system() == "Windows":
+    if IS_WINDOWS:
         create_windows_shortcut()
         print("You can also use the desktop shortcut if created.")
 
@@ -6,14 +6,234 @@ A simple mod manager that allows users to load, delete, and manage mod load orde
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import io
 import json
 import os
+import sys
+import errno
+import stat
 import shutil
 from pathlib import Path
 from typing import List, Dict, Any
 import configparser
 import subprocess
 import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Extra placeholder rows filled in below the visible viewport
+VIEWPORT_OVERSCAN = 10
+# Directory listings kept for quick re-navigation
+DIR_CACHE_SIZE = 64
+# Treeview inserts sent to Tcl per script
+INSERT_BATCH_SIZE = 500
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+# Mod list rows inserted per idle callback during a rebuild
+MOD_ROW_CHUNK = 200
+# File type filters offered when picking a mod file
+MOD_FILE_TYPES = (
+    ("All Mod Files", "*.zip *.rar *.7z *.pak *.ba2 *.esp *.esm"),
+    ("Archive Files", "*.zip *.rar *.7z"),
+    ("Game Files", "*.pak *.ba2 *.esp *.esm"),
+    ("All Files", "*.*")
+)
+# Lowercase extensions launch_game treats as executables
+EXE_EXTENSIONS = frozenset({'.exe', '.appimage', '.sh'})
+
+# Parsed configuration files keyed on (path, mtime_ns)
+_CONFIG_CACHE = {}
+
+# Largest single in-kernel copy request
+_COPY_CHUNK = 1 << 30
+# Parallel file copies when installing a mod folder; several requests in flight
+# keep an SSD's queue busy while each thread waits on its own syscalls
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Buffer for copies that go through user space; mod archives run to gigabytes,
+# so shutil's 16-64 KB default would mean tens of thousands of extra syscalls
+COPY_BUFSIZE = 4 * 1024 * 1024
+# Errors meaning "this copy method can't handle these files", not a real failure
+_COPY_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP,
+                     errno.EBADF, errno.ENOTSUP, errno.EPERM, errno.ENOTTY}
+
+# In-kernel copy methods, best first; each copies up to _COPY_CHUNK bytes
+# from the current offsets and returns the count, 0 at end of file
+_KERNEL_COPIES = []
+if hasattr(os, 'copy_file_range'):
+    _KERNEL_COPIES.append(lambda in_fd, out_fd: os.copy_file_range(in_fd, out_fd, _COPY_CHUNK))
+if sys.platform.startswith('linux') and hasattr(os, 'sendfile'):
+    _KERNEL_COPIES.append(lambda in_fd, out_fd: os.sendfile(out_fd, in_fd, None, _COPY_CHUNK))
+
+# Copy-on-write clones share the source's blocks, so even a multi-GB archive
+# copies instantly: FICLONE on Linux (btrfs, XFS), clonefile on macOS (APFS)
+_FICLONE = 0x40049409
+_clonefile = None
+if sys.platform.startswith('linux'):
+    import fcntl
+elif sys.platform == 'darwin':
+    import ctypes
+    try:
+        _clonefile = ctypes.CDLL(None, use_errno=True).clonefile
+        _clonefile.argtypes = (ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32)
+        _clonefile.restype = ctypes.c_int
+    except AttributeError:
+        _clonefile = None
+
+# Windows 8+ CopyFile2; on SMB shares it lets the server copy the data itself
+_CopyFile2 = None
+if sys.platform == 'win32':
+    import ctypes
+    from ctypes import wintypes
+    try:
+        _CopyFile2 = ctypes.windll.kernel32.CopyFile2
+        _CopyFile2.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p)
+        _CopyFile2.restype = ctypes.HRESULT  # Raises OSError on a failed HRESULT
+    except AttributeError:
+        _CopyFile2 = None
+
+
+def _reflink(in_fd: int, out_fd: int) -> bool:
+    """Clone one file descriptor's data into another; False if unsupported"""
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        fcntl.ioctl(out_fd, _FICLONE, in_fd)
+    except OSError as e:
+        if e.errno not in _COPY_UNSUPPORTED:
+            raise
+        return False
+    return True
+
+
+def _kernel_copy(in_fd: int, out_fd: int) -> bool:
+    """Copy one file descriptor to another inside the kernel; False if unsupported"""
+    size = os.fstat(in_fd).st_size
+    for copy in _KERNEL_COPIES:
+        copied = 0
+        try:
+            while True:
+                count = copy(in_fd, out_fd)
+                if not count:
+                    # Some filesystems report 0 instead of an error when they
+                    # can't copy; only trust it once data has been copied
+                    if copied or not size:
+                        return True
+                    break
+                copied += count
+        except OSError as e:
+            # Only fall back to the next method if nothing was written yet
+            if copied or e.errno not in _COPY_UNSUPPORTED:
+                raise
+    return False
+
+
+def _buffered_copy(fsrc, fdst):
+    """Copy between binary file objects through one reused buffer"""
+    # No larger than the file, so small mods don't allocate the full 4 MB;
+    # files reporting no size (empty, or special) still get read to the end
+    size = min(os.fstat(fsrc.fileno()).st_size, COPY_BUFSIZE) or io.DEFAULT_BUFFER_SIZE
+    buf = bytearray(size)
+    with memoryview(buf) as view:
+        while True:
+            count = fsrc.readinto(buf)
+            if not count:
+                break
+            fdst.write(view[:count])
+
+
+def _fastcopy(src: str, dst: str) -> str:
+    """Copy a file with its metadata like shutil.copy2, without user-space buffers where possible"""
+    # Opening dst for writing would truncate src, e.g. when a mod is picked
+    # from inside the mods folder
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    
+    if _CopyFile2 is not None:
+        try:
+            _CopyFile2(src, dst, None)
+        except OSError:
+            pass  # Fall back to the portable copy below
+        else:
+            shutil.copystat(src, dst)
+            return dst
+    
+    # clonefile creates dst itself; it fails if dst exists or the volume
+    # can't clone, and the copy below takes over
+    if _clonefile is not None and _clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+        shutil.copystat(src, dst)
+        return dst
+    
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        if not (_reflink(in_fd, out_fd) or _kernel_copy(in_fd, out_fd)):
+            _buffered_copy(fsrc, fdst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _clear_readonly(func, path, exc):
+    """rmtree error handler: on Windows, make a read-only entry writable and retry"""
+    # onerror passes an exc_info tuple, onexc the exception itself
+    if isinstance(exc, tuple):
+        exc = exc[1]
+    if sys.platform != 'win32' or not isinstance(exc, PermissionError):
+        raise exc
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def _rmtree(path: str):
+    """Delete a folder, including files marked read-only on Windows"""
+    # onerror was deprecated in favour of onexc in 3.12; the handler suits both
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_clear_readonly)
+    else:
+        shutil.rmtree(path, onerror=_clear_readonly)
+
+
+def _copytree(src: str, dst: str) -> str:
+    """Copy a folder like shutil.copytree, copying its files in parallel"""
+    # Like copytree, dst must not exist yet and symlinks are followed
+    os.makedirs(dst)
+    dirs_copied = []
+    # Like copytree, keep going past failures and raise them all at the end
+    errors = []
+    
+    def walk_error(err):
+        # os.walk skips unreadable folders silently unless told otherwise
+        errors.append((err.filename, os.path.join(dst, os.path.relpath(err.filename, src)), str(err)))
+    
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+        futures = {}
+        for root, dirs, files in os.walk(src, onerror=walk_error, followlinks=True):
+            dest_root = os.path.join(dst, os.path.relpath(root, src))
+            os.makedirs(dest_root, exist_ok=True)
+            dirs_copied.append((root, dest_root))
+            for name in files:
+                src_file = os.path.join(root, name)
+                dst_file = os.path.join(dest_root, name)
+                futures[executor.submit(_fastcopy, src_file, dst_file)] = (src_file, dst_file)
+        
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except OSError as e:
+                errors.append(futures[future] + (str(e),))
+    
+    # Directory timestamps last, since copying files into them changes their mtime
+    for root, dest_root in dirs_copied:
+        try:
+            shutil.copystat(root, dest_root)
+        except OSError as e:
+            errors.append((root, dest_root, str(e)))
+    if errors:
+        raise shutil.Error(errors)
+    return dst
 
 
 class ModManager:
@@ -29,93 +249,234 @@ class ModManager:
         self.game_path = ""
         self.mods_folder = ""
         self.mods_data = []
+        # Mod name -> position in mods_data, and -> row in the mod list
+        self._mod_index = {}
+        self._mod_items = {}
+        self._rebuild_token = 0
+        self._installing = False
         
         # File navigation improvements
-        self.recent_paths = {'game': [], 'mods': [], 'files': []}
+        # Recent paths are OrderedDicts used as ordered sets, newest first
+        self.recent_paths = {'game': OrderedDict(), 'mods': OrderedDict(), 'files': OrderedDict()}
         self.favorites = {'game': [], 'mods': []}
         self.max_recent_items = 10
+        self._dir_cache = OrderedDict()
+        self._dir_cache_lock = threading.Lock()
+        self._io_executor = ThreadPoolExecutor(max_workers=2)
+        self._config_flush_id = None
+        self._mods_flush_id = None
+        self._nav_after_id = None
+        self._saved_config = None
+        self._home = os.path.expanduser("~")
         
         self.load_config()
         self.setup_ui()
         self.load_mods_data()
-        self.refresh_mod_list()
+        self.rebuild_mod_list()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         
     def load_config(self):
         """Load configuration from INI file"""
-        config = configparser.ConfigParser()
-        if os.path.exists(self.config_file):
-            config.read(self.config_file)
-            self.game_path = config.get('Settings', 'game_path', fallback='')
-            self.mods_folder = config.get('Settings', 'mods_folder', fallback='')
-            
-            # Load recent paths and favorites
-            if config.has_section('RecentPaths'):
-                for key in ['game', 'mods', 'files']:
-                    paths_str = config.get('RecentPaths', f'{key}_paths', fallback='')
-                    if paths_str:
-                        self.recent_paths[key] = [p.strip() for p in paths_str.split('|') if p.strip()]
-            
-            if config.has_section('Favorites'):
-                for key in ['game', 'mods']:
-                    favorites_str = config.get('Favorites', f'{key}_favorites', fallback='')
-                    if favorites_str:
-                        self.favorites[key] = [p.strip() for p in favorites_str.split('|') if p.strip()]
+        try:
+            with open(self.config_file) as f:
+                # Parse each version of the file once; unchanged files reuse it
+                cache_key = (os.path.abspath(self.config_file), os.fstat(f.fileno()).st_mtime_ns)
+                settings = _CONFIG_CACHE.get(cache_key)
+                if settings is None:
+                    settings = self._parse_config(f)
+                    _CONFIG_CACHE[cache_key] = settings
+        except OSError:
+            # Missing or unreadable; start with defaults, as config.read() did,
+            # and only write a file once something actually changes
+            self._saved_config = json.dumps(self._config_snapshot(), sort_keys=True)
+            return
+        
+        self.game_path = settings['game_path']
+        self.mods_folder = settings['mods_folder']
+        for key, paths in settings['recent_paths'].items():
+            self.recent_paths[key] = OrderedDict.fromkeys(paths)
+        for key, favorites in settings['favorites'].items():
+            self.favorites[key] = list(favorites)
+        self._saved_config = json.dumps(self._config_snapshot(), sort_keys=True)
     
-    def save_config(self):
-        """Save configuration to INI file"""
-        config = configparser.ConfigParser()
-        config['Settings'] = {
+    def _parse_config(self, f) -> Dict[str, Any]:
+        """Parse the open INI file into plain settings"""
+        # Paths may contain '%', so read values raw
+        config = configparser.ConfigParser(interpolation=None)
+        config.read_file(f)
+        settings = {
+            'game_path': config.get('Settings', 'game_path', fallback=''),
+            'mods_folder': config.get('Settings', 'mods_folder', fallback=''),
+            'recent_paths': {},
+            'favorites': {}
+        }
+        
+        # Load recent paths and favorites
+        if config.has_section('RecentPaths'):
+            for key in ['game', 'mods', 'files']:
+                paths_str = config.get('RecentPaths', f'{key}_paths', fallback='')
+                if paths_str:
+                    settings['recent_paths'][key] = [p.strip() for p in paths_str.split('|') if p.strip()]
+        
+        if config.has_section('Favorites'):
+            for key in ['game', 'mods']:
+                favorites_str = config.get('Favorites', f'{key}_favorites', fallback='')
+                if favorites_str:
+                    settings['favorites'][key] = [p.strip() for p in favorites_str.split('|') if p.strip()]
+        return settings
+    
+    def _config_snapshot(self) -> Dict[str, Any]:
+        """Current configuration as it would be written to disk"""
+        return {
             'game_path': self.game_path,
-            'mods_folder': self.mods_folder
+            'mods_folder': self.mods_folder,
+            'recent_paths': {key: list(paths)[:self.max_recent_items]
+                             for key, paths in self.recent_paths.items()},
+            'favorites': {key: list(favorites) for key, favorites in self.favorites.items()}
         }
+    
+    def save_config(self):
+        """Save configuration to INI file"""
+        # Coalesce bursts of changes into one write shortly afterwards
+        if self._config_flush_id is None:
+            self._config_flush_id = self.root.after(500, self._flush_config)
+    
+    def _flush_config(self):
+        """Write pending configuration changes to the INI file"""
+        if self._config_flush_id is not None:
+            self.root.after_cancel(self._config_flush_id)
+            self._config_flush_id = None
+        
+        snapshot = self._config_snapshot()
+        serialized = json.dumps(snapshot, sort_keys=True)
+        if serialized == self._saved_config:
+            return
+        
+        # The file is flat, so emit the INI text directly rather than going
+        # through ConfigParser's section proxies
+        lines = ['[Settings]',
+                 f"game_path = {snapshot['game_path']}",
+                 f"mods_folder = {snapshot['mods_folder']}",
+                 '']
         
         # Save recent paths
-        config['RecentPaths'] = {}
-        for key, paths in self.recent_paths.items():
-            config['RecentPaths'][f'{key}_paths'] = '|'.join(paths[:self.max_recent_items])
+        lines.append('[RecentPaths]')
+        for key, paths in snapshot['recent_paths'].items():
+            lines.append(f"{key}_paths = {'|'.join(paths)}")
+        lines.append('')
         
         # Save favorites
-        config['Favorites'] = {}
-        for key, favorites in self.favorites.items():
-            config['Favorites'][f'{key}_favorites'] = '|'.join(favorites)
+        lines.append('[Favorites]')
+        for key, favorites in snapshot['favorites'].items():
+            lines.append(f"{key}_favorites = {'|'.join(favorites)}")
+        lines.append('')
         
-        with open(self.config_file, 'w') as f:
-            config.write(f)
+        # Write beside the old file and swap it in so a crash can't truncate it
+        tmp_path = self.config_file + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                f.write('\n'.join(lines) + '\n')
+            os.replace(tmp_path, self.config_file)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._saved_config = serialized
+    
+    def _on_close(self):
+        """Flush pending writes and close the window"""
+        # Closing now would leave a partial copy that mods_data never records
+        if self._installing:
+            messagebox.showwarning("Warning", "A mod is still being installed. Please wait for it to finish.")
+            return
+        try:
+            self._flush_mods_data()
+        except OSError as e:
+            # Still close; a failed save shouldn't trap the user in the app
+            messagebox.showerror("Error", f"Failed to save mods data: {str(e)}")
+        try:
+            self._flush_config()
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to save configuration: {str(e)}")
+        self.root.destroy()
     
     def load_mods_data(self):
         """Load mods data from JSON file"""
-        if os.path.exists(self.mods_file):
-            try:
-                with open(self.mods_file, 'r') as f:
-                    self.mods_data = json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                self.mods_data = []
-        else:
+        try:
+            # Parsing the whole file as bytes beats streaming it from a file object
+            data = Path(self.mods_file).read_bytes()
+            self.mods_data = orjson.loads(data) if orjson else json.loads(data)
+        except (ValueError, FileNotFoundError):
+            # A missing file, or a json/orjson decode error, starts empty
             self.mods_data = []
+        
+        # Sort once here; every change after this keeps priority equal to
+        # list position, so list positions always match tree rows
+        self.mods_data.sort(key=lambda x: x['priority'])
+        for i, mod in enumerate(self.mods_data):
+            mod['priority'] = i
     
     def save_mods_data(self):
         """Save mods data to JSON file"""
-        with open(self.mods_file, 'w') as f:
-            json.dump(self.mods_data, f, indent=2)
+        # Reordering a list is many clicks in a row; write once for all of them
+        if self._mods_flush_id is None:
+            self._mods_flush_id = self.root.after(500, self._flush_mods_data)
+    
+    def _flush_mods_data(self):
+        """Write pending mods data changes to the JSON file"""
+        if self._mods_flush_id is None:
+            return
+        self.root.after_cancel(self._mods_flush_id)
+        self._mods_flush_id = None
+        
+        # orjson is optional; it encodes the same compact output far faster
+        if orjson:
+            data = orjson.dumps(self.mods_data)
+        else:
+            data = json.dumps(self.mods_data, separators=(',', ':')).encode()
+        
+        # Replace the file in one step, so a crash mid-write can't truncate it
+        tmp_path = self.mods_file + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.mods_file)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
     
     def add_to_recent_paths(self, path_type: str, path: str):
         """Add a path to recent paths list"""
         if path and os.path.exists(path):
-            # Remove if already exists to avoid duplicates
-            if path in self.recent_paths[path_type]:
-                self.recent_paths[path_type].remove(path)
-            # Add to beginning of list
-            self.recent_paths[path_type].insert(0, path)
+            recent = self.recent_paths[path_type]
+            if next(iter(recent), None) == path:
+                return  # Already the newest; nothing to save
+            # Move to the front, adding it if new
+            recent[path] = None
+            recent.move_to_end(path, last=False)
             # Keep only max_recent_items
-            self.recent_paths[path_type] = self.recent_paths[path_type][:self.max_recent_items]
+            while len(recent) > self.max_recent_items:
+                recent.popitem(last=True)
             self.save_config()
     
+    def _center_toplevel(self, dlg: tk.Toplevel, width: int, height: int):
+        """Size a dialog and center it on screen"""
+        # Uses the design-time size, so no update_idletasks() flush is needed
+        x = (dlg.winfo_screenwidth() - width) // 2
+        y = (dlg.winfo_screenheight() - height) // 2
+        dlg.geometry(f"{width}x{height}+{x}+{y}")
+    
     def create_enhanced_file_dialog(self, dialog_type: str, title: str, path_type: str, 
                                    file_types=None, initial_dir=None):
         """Create an enhanced file dialog with recent paths and favorites"""
         dialog = tk.Toplevel(self.root)
         dialog.title(title)
-        dialog.geometry("700x500")
+        self._center_toplevel(dialog, 700, 500)
         dialog.transient(self.root)
         dialog.grab_set()
         
@@ -138,10 +499,10 @@ class ModManager:
         # Recent paths
         if self.recent_paths.get(path_type):
             ttk.Label(quick_frame, text="Recent:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
-            recent_combo = ttk.Combobox(quick_frame, values=self.recent_paths[path_type], state="readonly")
+            recent_combo = ttk.Combobox(quick_frame, values=list(self.recent_paths[path_type]), state="readonly")
             recent_combo.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(0, 5))
             ttk.Button(quick_frame, text="Go", 
-                      command=lambda: self.navigate_to_path(recent_combo.get(), path_var, tree)).grid(row=0, column=2)
+                      command=lambda: self.schedule_navigation(recent_combo.get(), path_var, tree)).grid(row=0, column=2)
         
         # Favorites
         fav_frame = ttk.Frame(quick_frame)
@@ -154,7 +515,7 @@ class ModManager:
             fav_combo = ttk.Combobox(fav_frame, values=favorites_list, state="readonly")
             fav_combo.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(0, 5))
             ttk.Button(fav_frame, text="Go", 
-                      command=lambda: self.navigate_to_path(fav_combo.get(), path_var, tree)).grid(row=0, column=2, padx=(0, 5))
+                      command=lambda: self.schedule_navigation(fav_combo.get(), path_var, tree)).grid(row=0, column=2, padx=(0, 5))
         
         # Current path frame
         path_frame = ttk.Frame(main_frame)
@@ -162,17 +523,17 @@ class ModManager:
         path_frame.columnconfigure(1, weight=1)
         
         ttk.Label(path_frame, text="Current Path:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
-        path_var = tk.StringVar(value=initial_dir or os.path.expanduser("~"))
+        path_var = tk.StringVar(value=initial_dir or self._home)
         path_entry = ttk.Entry(path_frame, textvariable=path_var)
         path_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(0, 5))
-        path_entry.bind('<Return>', lambda e: self.navigate_to_path(path_var.get(), path_var, tree))
+        path_entry.bind('<Return>', lambda e: self.schedule_navigation(path_var.get(), path_var, tree))
         
         ttk.Button(path_frame, text="Up", 
                   command=lambda: self.navigate_up(path_var, tree)).grid(row=0, column=2, padx=(0, 5))
         ttk.Button(path_frame, text="Home", 
-                  command=lambda: self.navigate_to_path(os.path.expanduser("~"), path_var, tree)).grid(row=0, column=3, padx=(0, 5))
+                  command=lambda: self.schedule_navigation(self._home, path_var, tree)).grid(row=0, column=3, padx=(0, 5))
         ttk.Button(path_frame, text="Refresh", 
-                  command=lambda: self.navigate_to_path(path_var.get(), path_var, tree)).grid(row=0, column=4)
+                  command=lambda: self.schedule_navigation(path_var.get(), path_var, tree)).grid(row=0, column=4)
         
         # File browser tree
         tree_frame = ttk.Frame(main_frame)
@@ -188,8 +549,28 @@ class ModManager:
         tree.column('size', width=100)
         tree.column('modified', width=150)
         
+        # Configure tags for visual distinction
+        tree.tag_configure('folder', foreground='blue')
+        tree.tag_configure('file', foreground='black')
+        
+        # Browser state lives on the tree, which every navigation helper receives
+        tree.nav_token = 0
+        tree.nav_stack = []
+        tree.next_row_id = 0
+        tree.row_paths = {}
+        tree.pending_rows = {}
+        tree.expanded_rows = set()
+        
         tree_scroll = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=tree.yview)
-        tree.configure(yscrollcommand=tree_scroll.set)
+        
+        def on_tree_scroll(first, last):
+            tree_scroll.set(first, last)
+            self._render_visible_rows(tree)
+        
+        # Every view change (scrollbar, wheel, keys, resize) reports here
+        tree.configure(yscrollcommand=on_tree_scroll)
+        tree.bind('<Configure>', lambda e: self._render_visible_rows(tree))
+        tree.bind('<<TreeviewOpen>>', lambda e: self.on_tree_expand(tree))
         
         tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         tree_scroll.grid(row=0, column=1, sticky=(tk.N, tk.S))
@@ -220,73 +601,250 @@ class ModManager:
         # Initialize tree
         self.navigate_to_path(path_var.get(), path_var, tree)
         
-        # Center dialog
-        dialog.update_idletasks()
-        width = dialog.winfo_width()
-        height = dialog.winfo_height()
-        x = (dialog.winfo_screenwidth() // 2) - (width // 2)
-        y = (dialog.winfo_screenheight() // 2) - (height // 2)
-        dialog.geometry(f"{width}x{height}+{x}+{y}")
-        
         # Wait for dialog to close
         self.root.wait_window(dialog)
         return result['path']
     
+    def schedule_navigation(self, path: str, path_var: tk.StringVar, tree: ttk.Treeview):
+        """Navigate shortly, so repeated clicks or keystrokes scan only once"""
+        if self._nav_after_id is not None:
+            self.root.after_cancel(self._nav_after_id)
+        self._nav_after_id = self.root.after(100, self._run_scheduled_navigation, path, path_var, tree)
+    
+    def _run_scheduled_navigation(self, path: str, path_var: tk.StringVar, tree: ttk.Treeview):
+        """Run the pending navigation if its dialog is still open"""
+        self._nav_after_id = None
+        if tree.winfo_exists():
+            self.navigate_to_path(path, path_var, tree)
+    
     def navigate_to_path(self, path: str, path_var: tk.StringVar, tree: ttk.Treeview):
         """Navigate to a specific path in the tree"""
         if not path or not os.path.exists(path):
             return
+        # One spelling per directory, so the listing cache keys line up
+        path = os.path.normpath(path)
+        
+        path_var.set(path)
+        self.status_var.set(f"Loading {path}…")
+        
+        # List the directory off the UI thread; results from a navigation
+        # that has since been superseded are dropped
+        tree.nav_token += 1
+        token = tree.nav_token
+        future = self._io_executor.submit(self._list_directory, path)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._apply_entries, tree, path, token, f))
+    
+    def _apply_entries(self, tree: ttk.Treeview, path: str, token: int, future):
+        """Show a finished directory listing in the tree"""
+        if not tree.winfo_exists():
+            self.status_var.set("Ready")  # Dialog closed mid-scan
+            return
+        if token != tree.nav_token:
+            return
+        self.status_var.set("Ready")
         
         try:
-            # Clear tree
-            for item in tree.get_children():
-                tree.delete(item)
-            
-            path_var.set(path)
-            
-            # Add parent directory if not at root
-            if path != os.path.dirname(path):
-                tree.insert('', 'end', text='..', values=('', ''), tags=('folder',))
-            
-            # List directory contents
-            items = []
             try:
-                for item in os.listdir(path):
-                    item_path = os.path.join(path, item)
-                    try:
-                        stat = os.stat(item_path)
-                        size = self.format_size(stat.st_size) if os.path.isfile(item_path) else ''
-                        modified = time.strftime('%Y-%m-%d %H:%M', time.localtime(stat.st_mtime))
-                        is_dir = os.path.isdir(item_path)
-                        items.append((item, size, modified, is_dir))
-                    except (OSError, PermissionError):
-                        # Skip items we can't access
-                        continue
+                items = future.result()
             except PermissionError:
                 messagebox.showerror("Permission Error", f"Cannot access directory: {path}")
                 return
-            
-            # Sort: directories first, then files
-            items.sort(key=lambda x: (not x[3], x[0].lower()))
-            
-            # Add items to tree
-            for item, size, modified, is_dir in items:
-                tag = 'folder' if is_dir else 'file'
-                tree.insert('', 'end', text=item, values=(size, modified), tags=(tag,))
-            
-            # Configure tags for visual distinction
-            tree.tag_configure('folder', foreground='blue')
-            tree.tag_configure('file', foreground='black')
-            
+            self._show_entries(tree, path, items)
         except Exception as e:
             messagebox.showerror("Error", f"Error navigating to path: {str(e)}")
     
+    def _show_entries(self, tree: ttk.Treeview, path: str, items: List[tuple]):
+        """Replace the tree contents with a directory listing"""
+        # Clear tree
+        for item in tree.get_children():
+            tree.delete(item)
+        
+        # Add parent directory if not at root
+        parent = os.path.dirname(path)
+        if path != parent:
+            tree.insert('', 'end', text='..', values=('', ''), tags=('folder',))
+        
+        tree.row_paths = {}
+        tree.pending_rows = {}
+        tree.expanded_rows = set()
+        self._insert_entries(tree, '', path, items)
+        self._render_visible_rows(tree)
+        
+        # Keep the listings of the folders above this one so Up can reuse
+        # them; anything that is not an ancestor of path is dropped
+        stack = tree.nav_stack
+        while stack and not path.startswith(stack[-1][0].rstrip(os.sep) + os.sep):
+            stack.pop()
+        stack.append((path, items))
+    
+    def _list_directory(self, path: str) -> List[tuple]:
+        """List a directory as sorted (is_file, sort_name, name, st_size, st_mtime, is_dir) tuples"""
+        # Any entry added, removed or renamed bumps the directory's mtime
+        key = (path, os.stat(path).st_mtime_ns)
+        with self._dir_cache_lock:
+            cached = self._dir_cache.get(key)
+            if cached is not None:
+                self._dir_cache.move_to_end(key)
+                return cached
+        
+        items = []
+        # DirEntry carries the file type from readdir, so each entry costs
+        # one stat at most (and none on Windows) instead of three
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    stat = entry.stat()
+                    is_dir = entry.is_dir()
+                except OSError:
+                    # Skip items we can't access
+                    continue
+                # Leading sort key lets list.sort() use plain tuple comparison;
+                # size and date are formatted only once a row is displayed
+                items.append((0 if is_dir else 1, entry.name.casefold(), entry.name,
+                              stat.st_size, stat.st_mtime, is_dir))
+        
+        # Sort: directories first, then files
+        items.sort()
+        
+        with self._dir_cache_lock:
+            self._dir_cache[key] = items
+            if len(self._dir_cache) > DIR_CACHE_SIZE:
+                self._dir_cache.popitem(last=False)
+        return items
+    
+    def _invalidate_dir_cache(self, path: str):
+        """Drop cached listings of path after changing its contents"""
+        # Keys are normalized by navigate_to_path; the mods folder may be
+        # spelled with '/' on Windows or carry a trailing separator
+        path = os.path.normpath(path)
+        with self._dir_cache_lock:
+            for key in [key for key in self._dir_cache if key[0] == path]:
+                del self._dir_cache[key]
+    
+    def _insert_entries(self, tree: ttk.Treeview, parent: str, dir_path: str, items: List[tuple]):
+        """Add an empty row per item; rows are filled in as they scroll into view"""
+        # Rows only carry a generated id and a tag until they are rendered,
+        # so a whole batch can be created with a single Tcl script instead
+        # of one tree.insert() round trip per row
+        widget = str(tree)
+        parent_id = parent or '{}'
+        row_id = tree.next_row_id
+        script = []
+        for item in items:
+            name, is_dir = item[2], item[5]
+            row = f'r{row_id}'
+            row_id += 1
+            tree.row_paths[row] = os.path.join(dir_path, name)
+            tree.pending_rows[row] = item
+            if is_dir:
+                script.append(f'{widget} insert {parent_id} end -id {row} -tags folder')
+                # Placeholder child so the folder can be expanded; its
+                # contents are only listed when that happens
+                script.append(f'{widget} insert {row} end -tags placeholder')
+            else:
+                script.append(f'{widget} insert {parent_id} end -id {row} -tags file')
+            if len(script) >= INSERT_BATCH_SIZE:
+                tree.tk.eval('\n'.join(script))
+                script.clear()
+        if script:
+            tree.tk.eval('\n'.join(script))
+        tree.next_row_id = row_id
+    
+    def on_tree_expand(self, tree: ttk.Treeview):
+        """List a folder's contents the first time it is expanded"""
+        row = tree.focus()
+        if row in tree.expanded_rows or row not in tree.row_paths:
+            return
+        tree.expanded_rows.add(row)
+        
+        placeholders = tree.get_children(row)
+        if placeholders:
+            tree.item(placeholders[0], text='Loading…')
+        future = self._io_executor.submit(self._list_directory, tree.row_paths[row])
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._apply_expansion, tree, row, placeholders, f))
+    
+    def _apply_expansion(self, tree: ttk.Treeview, row: str, placeholders: tuple, future):
+        """Replace an expanded folder's placeholder with its listing"""
+        if not tree.winfo_exists() or not tree.exists(row):
+            return
+        try:
+            items = future.result()
+        except OSError:
+            items = []
+        tree.delete(*placeholders)
+        self._insert_entries(tree, row, tree.row_paths[row], items)
+        self._render_visible_rows(tree)
+    
+    def _render_visible_rows(self, tree: ttk.Treeview):
+        """Fill in the placeholder rows currently inside the viewport"""
+        pending = tree.pending_rows
+        if not pending:
+            return
+        
+        row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+        remaining = max(tree.winfo_height() // row_height, int(tree.cget('height'))) + VIEWPORT_OVERSCAN
+        
+        # Topmost row on screen (the heading sits above it)
+        row = ''
+        for y in range(0, 3 * row_height, max(1, row_height // 2)):
+            row = tree.identify_row(y)
+            if row:
+                break
+        if not row:
+            children = tree.get_children()
+            row = children[0] if children else ''
+        
+        while row and remaining > 0:
+            item = pending.pop(row, None)
+            if item is not None:
+                _, _, name, size, mtime, is_dir = item
+                size = '' if is_dir else self.format_size(size)
+                modified = time.strftime('%Y-%m-%d %H:%M', time.localtime(mtime))
+                tree.item(row, text=name, values=(size, modified))
+            row = self._next_visible_row(tree, row)
+            remaining -= 1
+    
+    def _next_visible_row(self, tree: ttk.Treeview, row: str) -> str:
+        """Row shown directly below row, descending into expanded folders"""
+        if tree.tk.getboolean(tree.item(row, 'open')):
+            children = tree.get_children(row)
+            if children:
+                return children[0]
+        while row:
+            sibling = tree.next(row)
+            if sibling:
+                return sibling
+            row = tree.parent(row)
+        return ''
+    
     def navigate_up(self, path_var: tk.StringVar, tree: ttk.Treeview):
         """Navigate to parent directory"""
         current_path = path_var.get()
         parent_path = os.path.dirname(current_path)
         if parent_path != current_path:  # Not at root
-            self.navigate_to_path(parent_path, path_var, tree)
+            stack = tree.nav_stack
+            if (len(stack) >= 2 and stack[-1][0] == current_path and stack[-2][0] == parent_path
+                    and self._is_current_listing(parent_path, stack[-2][1])):
+                # Parent was listed on the way down and hasn't changed since;
+                # show it again without a scan
+                stack.pop()
+                path_var.set(parent_path)
+                tree.nav_token += 1  # Drops any scan still in flight
+                self.status_var.set("Ready")
+                self._show_entries(tree, parent_path, stack.pop()[1])
+            else:
+                self.navigate_to_path(parent_path, path_var, tree)
+    
+    def _is_current_listing(self, path: str, items: List[tuple]) -> bool:
+        """Check that items is still the cached listing for path's current mtime"""
+        try:
+            key = (path, os.stat(path).st_mtime_ns)
+        except OSError:
+            return False
+        with self._dir_cache_lock:
+            return self._dir_cache.get(key) is items
     
     def on_tree_double_click(self, tree: ttk.Treeview, path_var: tk.StringVar, tree_widget: ttk.Treeview, 
                            dialog_type: str, result=None, dialog=None):
@@ -297,13 +855,14 @@ class ModManager:
         
         item = selection[0]
         item_text = tree.item(item)['text']
-        current_path = path_var.get()
         
         if item_text == '..':
             # Go to parent directory
             self.navigate_up(path_var, tree_widget)
         else:
-            item_path = os.path.join(current_path, item_text)
+            item_path = tree.row_paths.get(item)
+            if not item_path:
+                return 'break'
             if os.path.isdir(item_path):
                 # Navigate to directory
                 self.navigate_to_path(item_path, path_var, tree_widget)
@@ -311,6 +870,9 @@ class ModManager:
                 # Select file and close dialog
                 result['path'] = item_path
                 dialog.destroy()
+        
+        # Stop the default double-click from also toggling the item open
+        return 'break'
     
     def confirm_selection(self, tree: ttk.Treeview, path_var: tk.StringVar, result: dict, 
                          dialog: tk.Toplevel, dialog_type: str):
@@ -324,7 +886,7 @@ class ModManager:
                 item = selection[0]
                 item_text = tree.item(item)['text']
                 if item_text != '..':
-                    item_path = os.path.join(path_var.get(), item_text)
+                    item_path = tree.row_paths.get(item, '')
                     if os.path.isfile(item_path):
                         result['path'] = item_path
                     else:
@@ -345,17 +907,17 @@ class ModManager:
     
     def format_size(self, size: int) -> str:
         """Format file size in human-readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
+        if size < 1024:
+            return f"{size:.1f} B"
+        # Each unit step is 10 bits, so the bit length picks the unit directly
+        exp = min((size.bit_length() - 1) // 10, 4)
+        return f"{size / (1 << (exp * 10)):.1f} {SIZE_UNITS[exp]}"
     
     def manage_paths(self):
         """Open path management dialog"""
         dialog = tk.Toplevel(self.root)
         dialog.title("Manage Paths - Recent & Favorites")
-        dialog.geometry("600x500")
+        self._center_toplevel(dialog, 600, 500)
         dialog.transient(self.root)
         dialog.grab_set()
         
@@ -383,6 +945,7 @@ class ModManager:
                  font=('Arial', 12, 'bold')).grid(row=0, column=0, columnspan=2, pady=(0, 10))
         
         # Recent paths lists
+        self._recent_listboxes = {}
         for i, (path_type, paths) in enumerate(self.recent_paths.items()):
             if paths:
                 ttk.Label(recent_frame, text=f"{path_type.title()}:").grid(
@@ -391,6 +954,7 @@ class ModManager:
                 listbox = tk.Listbox(recent_frame, height=4)
                 listbox.grid(row=i+1, column=1, sticky=(tk.W, tk.E), padx=(10, 0), pady=(5, 0))
                 recent_frame.columnconfigure(1, weight=1)
+                self._recent_listboxes[path_type] = listbox
                 
                 for path in paths:
                     listbox.insert(tk.END, path)
@@ -429,22 +993,13 @@ class ModManager:
         # Close button
         ttk.Button(main_frame, text="Close", command=dialog.destroy).grid(
             row=2, column=0, pady=(10, 0))
-        
-        # Center dialog
-        dialog.update_idletasks()
-        width = dialog.winfo_width()
-        height = dialog.winfo_height()
-        x = (dialog.winfo_screenwidth() // 2) - (width // 2)
-        y = (dialog.winfo_screenheight() // 2) - (height // 2)
-        dialog.geometry(f"{width}x{height}+{x}+{y}")
     
     def clear_recent_paths(self, path_type: str, dialog: tk.Toplevel):
         """Clear recent paths for a specific type"""
-        if messagebox.askyesno("Confirm", f"Clear all recent {path_type} paths?"):
-            self.recent_paths[path_type] = []
+        if messagebox.askyesno("Confirm", f"Clear all recent {path_type} paths?", parent=dialog):
+            self.recent_paths[path_type] = OrderedDict()
             self.save_config()
-            dialog.destroy()
-            self.manage_paths()  # Refresh the dialog
+            self._recent_listboxes[path_type].delete(0, tk.END)
     
     def remove_favorite(self, path_type: str, dialog: tk.Toplevel):
         """Remove selected favorite"""
@@ -486,6 +1041,9 @@ class ModManager:
             row=0, column=1, sticky=(tk.W, tk.E), padx=(5, 5))
         ttk.Button(path_frame, text="Browse", command=self.select_game_path).grid(
             row=0, column=2, padx=(5, 0))
+        self.create_path_menubutton(path_frame, 'game', self.set_game_path,
+                                    lambda: self.select_game_path(quick_access=True)).grid(
+            row=0, column=3, padx=(5, 0))
         
         ttk.Label(path_frame, text="Mods Folder:").grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
         self.mods_folder_var = tk.StringVar(value=self.mods_folder)
@@ -493,6 +1051,9 @@ class ModManager:
             row=1, column=1, sticky=(tk.W, tk.E), padx=(5, 5), pady=(5, 0))
         ttk.Button(path_frame, text="Browse", command=self.select_mods_folder).grid(
             row=1, column=2, padx=(5, 0), pady=(5, 0))
+        self.create_path_menubutton(path_frame, 'mods', self.set_mods_folder,
+                                    lambda: self.select_mods_folder(quick_access=True)).grid(
+            row=1, column=3, padx=(5, 0), pady=(5, 0))
         
         # Mod list frame
         list_frame = ttk.LabelFrame(main_frame, text="Installed Mods", padding="10")
@@ -546,7 +1107,7 @@ class ModManager:
         ttk.Separator(buttons_frame, orient='horizontal').grid(
             row=6, column=0, sticky=(tk.W, tk.E), pady=10)
         
-        ttk.Button(buttons_frame, text="Refresh", command=self.refresh_mod_list).grid(
+        ttk.Button(buttons_frame, text="Refresh", command=self.rebuild_mod_list).grid(
             row=7, column=0, pady=(0, 5), sticky=(tk.W, tk.E))
         
         ttk.Button(buttons_frame, text="Manage Paths", command=self.manage_paths).grid(
@@ -569,48 +1130,91 @@ class ModManager:
         else:
             self.launch_btn.state(["disabled"])
 
-    def select_game_path(self):
+    def create_path_menubutton(self, parent, path_type: str, apply_path, browse_quick_access):
+        """Create a "Recent" menubutton listing recent and favorite paths"""
+        menubutton = ttk.Menubutton(parent, text="Recent ▾")
+        menu = tk.Menu(menubutton, tearoff=0)
+        menu.configure(postcommand=lambda: self.populate_path_menu(
+            menu, path_type, apply_path, browse_quick_access))
+        menubutton['menu'] = menu
+        return menubutton
+    
+    def populate_path_menu(self, menu: tk.Menu, path_type: str, apply_path, browse_quick_access):
+        """Fill a path menu from the stored paths; no filesystem access"""
+        menu.delete(0, tk.END)
+        for path in self.recent_paths[path_type]:
+            menu.add_command(label=path, command=lambda p=path: apply_path(p))
+        
+        favorites = self.favorites.get(path_type, [])
+        if favorites:
+            if menu.index(tk.END) is not None:
+                menu.add_separator()
+            for path in favorites:
+                menu.add_command(label=f"★ {path}", command=lambda p=path: apply_path(p))
+        
+        if menu.index(tk.END) is not None:
+            menu.add_separator()
+        menu.add_command(label="Browse with Quick Access…", command=browse_quick_access)
+    
+    def select_game_path(self, quick_access: bool = False):
         """Select game installation path"""
         initial_dir = self.game_path if self.game_path and os.path.exists(self.game_path) else None
-        path = self.create_enhanced_file_dialog(
-            'folder', 
-            "Select Game Installation Folder", 
-            'game',
-            initial_dir=initial_dir
-        )
+        if quick_access:
+            path = self.create_enhanced_file_dialog(
+                'folder', 
+                "Select Game Installation Folder", 
+                'game',
+                initial_dir=initial_dir
+            )
+        else:
+            # The native dialog is the OS shell's own, already fast browser
+            path = filedialog.askdirectory(parent=self.root, title="Select Game Installation Folder",
+                                           initialdir=initial_dir, mustexist=True)
         
         if path:
-            # Use os.access to check read permissions
-            if not os.access(path, os.R_OK | os.X_OK):
-                messagebox.showerror("Permission Error", "Cannot access the selected directory. Please check read/execute permissions.")
-                return
-            self.game_path = path
-            self.game_path_var.set(path)
-            self.add_to_recent_paths('game', path)
-            self.save_config()
-            self.status_var.set(f"Game path set to: {path}")
-            self.update_launch_button_state()
+            self.set_game_path(path)
+    
+    def set_game_path(self, path: str):
+        """Use path as the game installation path"""
+        # Use os.access to check read permissions
+        if not os.access(path, os.R_OK | os.X_OK):
+            messagebox.showerror("Permission Error", "Cannot access the selected directory. Please check read/execute permissions.")
+            return
+        self.game_path = path
+        self.game_path_var.set(path)
+        self.add_to_recent_paths('game', path)
+        self.save_config()
+        self.status_var.set(f"Game path set to: {path}")
+        self.update_launch_button_state()
 
-    def select_mods_folder(self):
+    def select_mods_folder(self, quick_access: bool = False):
         """Select mods folder"""
         initial_dir = self.mods_folder if self.mods_folder and os.path.exists(self.mods_folder) else None
-        path = self.create_enhanced_file_dialog(
-            'folder', 
-            "Select Mods Folder", 
-            'mods',
-            initial_dir=initial_dir
-        )
+        if quick_access:
+            path = self.create_enhanced_file_dialog(
+                'folder', 
+                "Select Mods Folder", 
+                'mods',
+                initial_dir=initial_dir
+            )
+        else:
+            path = filedialog.askdirectory(parent=self.root, title="Select Mods Folder",
+                                           initialdir=initial_dir, mustexist=True)
         
         if path:
-            # Use os.access to check read and write permissions
-            if not os.access(path, os.R_OK | os.W_OK | os.X_OK):
-                messagebox.showerror("Permission Error", "Cannot write to the selected directory. Please check read/write/execute permissions.")
-                return
-            self.mods_folder = path
-            self.mods_folder_var.set(path)
-            self.add_to_recent_paths('mods', path)
-            self.save_config()
-            self.status_var.set(f"Mods folder set to: {path}")
+            self.set_mods_folder(path)
+    
+    def set_mods_folder(self, path: str):
+        """Use path as the mods folder"""
+        # Use os.access to check read and write permissions
+        if not os.access(path, os.R_OK | os.W_OK | os.X_OK):
+            messagebox.showerror("Permission Error", "Cannot write to the selected directory. Please check read/write/execute permissions.")
+            return
+        self.mods_folder = path
+        self.mods_folder_var.set(path)
+        self.add_to_recent_paths('mods', path)
+        self.save_config()
+        self.status_var.set(f"Mods folder set to: {path}")
     
     def add_mod(self):
         """Add a new mod"""
@@ -621,18 +1225,10 @@ class ModManager:
         # Create selection dialog
         selection_dialog = tk.Toplevel(self.root)
         selection_dialog.title("Add Mod - Select Type")
-        selection_dialog.geometry("400x200")
+        self._center_toplevel(selection_dialog, 400, 240)
         selection_dialog.transient(self.root)
         selection_dialog.grab_set()
         
-        # Center the dialog
-        selection_dialog.update_idletasks()
-        width = selection_dialog.winfo_width()
-        height = selection_dialog.winfo_height()
-        x = (selection_dialog.winfo_screenwidth() // 2) - (width // 2)
-        y = (selection_dialog.winfo_screenheight() // 2) - (height // 2)
-        selection_dialog.geometry(f"{width}x{height}+{x}+{y}")
-        
         # Main frame
         main_frame = ttk.Frame(selection_dialog, padding="20")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -644,53 +1240,58 @@ class ModManager:
                  font=('Arial', 12)).grid(row=0, column=0, columnspan=2, pady=(0, 20))
         
         # Buttons
+        quick_access_var = tk.BooleanVar(value=False)
         ttk.Button(main_frame, text="📁 Mod Folder", 
-                  command=lambda: self.add_mod_folder_enhanced(selection_dialog),
+                  command=lambda: self.add_mod_folder_enhanced(selection_dialog, quick_access_var.get()),
                   width=20).grid(row=1, column=0, padx=(0, 10), pady=(0, 10))
         
         ttk.Button(main_frame, text="📄 Mod File", 
-                  command=lambda: self.add_mod_file_enhanced(selection_dialog),
+                  command=lambda: self.add_mod_file_enhanced(selection_dialog, quick_access_var.get()),
                   width=20).grid(row=1, column=1, padx=(10, 0), pady=(0, 10))
         
+        ttk.Checkbutton(main_frame, text="Browse with recent paths & favorites",
+                        variable=quick_access_var).grid(row=2, column=0, columnspan=2)
+        
         # Description
         desc_text = ("• Mod Folder: Select a folder containing mod files\n"
                     "• Mod File: Select individual mod files (.zip, .rar, .esp, etc.)")
         ttk.Label(main_frame, text=desc_text, font=('Arial', 9), 
-                 foreground='gray').grid(row=2, column=0, columnspan=2, pady=(10, 10))
+                 foreground='gray').grid(row=3, column=0, columnspan=2, pady=(10, 10))
         
         # Cancel button
         ttk.Button(main_frame, text="Cancel", 
-                  command=selection_dialog.destroy).grid(row=3, column=0, columnspan=2, pady=(10, 0))
+                  command=selection_dialog.destroy).grid(row=4, column=0, columnspan=2, pady=(10, 0))
     
-    def add_mod_file_enhanced(self, parent_dialog=None):
-        """Add a mod file using enhanced dialog"""
+    def add_mod_file_enhanced(self, parent_dialog=None, quick_access: bool = False):
+        """Add a mod file using the native or enhanced dialog"""
         if parent_dialog:
             parent_dialog.destroy()
         
         # Get recent file directory or use mods folder
         initial_dir = None
         if self.recent_paths['files']:
-            initial_dir = os.path.dirname(self.recent_paths['files'][0])
+            initial_dir = os.path.dirname(next(iter(self.recent_paths['files'])))
         if not initial_dir or not os.path.exists(initial_dir):
             initial_dir = self.mods_folder
         
-        file_path = self.create_enhanced_file_dialog(
-            'file',
-            "Select Mod File",
-            'files',
-            file_types=[
-                ("All Mod Files", "*.zip *.rar *.7z *.pak *.ba2 *.esp *.esm"),
-                ("Archive Files", "*.zip *.rar *.7z"),
-                ("Game Files", "*.pak *.ba2 *.esp *.esm"),
-                ("All Files", "*.*")
-            ],
-            initial_dir=initial_dir
-        )
+        if quick_access:
+            file_path = self.create_enhanced_file_dialog(
+                'file',
+                "Select Mod File",
+                'files',
+                file_types=MOD_FILE_TYPES,
+                initial_dir=initial_dir
+            )
+        else:
+            file_path = filedialog.askopenfilename(parent=self.root, title="Select Mod File",
+                                                   initialdir=initial_dir, filetypes=MOD_FILE_TYPES)
         
         if file_path:
+            # A single access() check instead of opening and reading the file
+            if not os.access(file_path, os.R_OK):
+                messagebox.showerror("Permission Error", "Cannot access the selected file. Please check permissions.")
+                return
             try:
-                with open(file_path, 'rb') as f:
-                    f.read(1)  # Test file access
                 self.add_to_recent_paths('files', file_path)
                 self.install_mod_file(file_path)
             except PermissionError:
@@ -698,28 +1299,34 @@ class ModManager:
             except Exception as e:
                 messagebox.showerror("Error", f"Error accessing file: {str(e)}")
     
-    def add_mod_folder_enhanced(self, parent_dialog=None):
-        """Add a mod folder using enhanced dialog"""
+    def add_mod_folder_enhanced(self, parent_dialog=None, quick_access: bool = False):
+        """Add a mod folder using the native or enhanced dialog"""
         if parent_dialog:
             parent_dialog.destroy()
         
         # Get recent folder directory or use current directory
         initial_dir = None
         if self.recent_paths['files']:
-            initial_dir = os.path.dirname(self.recent_paths['files'][0])
+            initial_dir = os.path.dirname(next(iter(self.recent_paths['files'])))
         if not initial_dir or not os.path.exists(initial_dir):
-            initial_dir = os.path.expanduser("~")
-        
-        folder_path = self.create_enhanced_file_dialog(
-            'folder',
-            "Select Mod Folder",
-            'files',
-            initial_dir=initial_dir
-        )
+            initial_dir = self._home
+        
+        if quick_access:
+            folder_path = self.create_enhanced_file_dialog(
+                'folder',
+                "Select Mod Folder",
+                'files',
+                initial_dir=initial_dir
+            )
+        else:
+            folder_path = filedialog.askdirectory(parent=self.root, title="Select Mod Folder",
+                                                  initialdir=initial_dir, mustexist=True)
         
         if folder_path:
             try:
-                os.listdir(folder_path)
+                # Probe access with the first entry rather than listing everything
+                with os.scandir(folder_path) as it:
+                    next(it, None)
                 self.add_to_recent_paths('files', folder_path)
                 self.install_mod_folder(folder_path)
             except PermissionError:
@@ -729,62 +1336,82 @@ class ModManager:
     
     def install_mod_file(self, file_path: str):
         """Install a mod from file"""
-        try:
-            filename = os.path.basename(file_path)
-            mod_name = os.path.splitext(filename)[0]
-            
-            # Create mod entry
-            mod_data = {
-                'id': len(self.mods_data),
-                'name': mod_name,
-                'file_path': filename,
-                'original_path': file_path,
-                'enabled': True,
-                'priority': len(self.mods_data),
-                'type': 'file'
-            }
-            
-            # Copy file to mods folder
-            dest_path = os.path.join(self.mods_folder, filename)
-            shutil.copy2(file_path, dest_path)
-            
-            self.mods_data.append(mod_data)
-            self.save_mods_data()
-            self.refresh_mod_list()
-            
-            self.status_var.set(f"Mod '{mod_name}' added successfully!")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to install mod: {str(e)}")
+        filename = os.path.basename(file_path)
+        mod_name = os.path.splitext(filename)[0]
+        
+        # Create mod entry; id and priority are assigned once the copy is done
+        mod_data = {
+            'id': None,
+            'name': mod_name,
+            'file_path': filename,
+            'original_path': file_path,
+            'enabled': True,
+            'priority': None,
+            'type': 'file'
+        }
+        
+        # Copy file to mods folder
+        dest_path = os.path.join(self.mods_folder, filename)
+        self._start_install(_fastcopy, file_path, dest_path, mod_data)
     
     def install_mod_folder(self, folder_path: str):
         """Install a mod from folder"""
-        try:
-            folder_name = os.path.basename(folder_path)
-            
-            # Create mod entry
-            mod_data = {
-                'id': len(self.mods_data),
-                'name': folder_name,
-                'file_path': folder_name,
-                'original_path': folder_path,
-                'enabled': True,
-                'priority': len(self.mods_data),
-                'type': 'folder'
-            }
-            
-            # Copy folder to mods folder
-            dest_path = os.path.join(self.mods_folder, folder_name)
-            shutil.copytree(folder_path, dest_path)
-            
-            self.mods_data.append(mod_data)
-            self.save_mods_data()
-            self.refresh_mod_list()
-            
-            self.status_var.set(f"Mod '{folder_name}' added successfully!")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to install mod: {str(e)}")
+        folder_name = os.path.basename(folder_path)
+        
+        # Create mod entry; id and priority are assigned once the copy is done
+        mod_data = {
+            'id': None,
+            'name': folder_name,
+            'file_path': folder_name,
+            'original_path': folder_path,
+            'enabled': True,
+            'priority': None,
+            'type': 'folder'
+        }
+        
+        # Copy folder to mods folder
+        dest_path = os.path.join(self.mods_folder, folder_name)
+        self._start_install(_copytree, folder_path, dest_path, mod_data)
+    
+    def _start_install(self, copy, src: str, dest: str, mod_data: Dict[str, Any]):
+        """Copy a mod into the mods folder on a background thread"""
+        if self._installing:
+            messagebox.showwarning("Warning", "Another mod is still being installed!")
+            return
+        self._installing = True
+        self.status_var.set(f"Installing '{mod_data['name']}'…")
+        
+        def do_copy():
+            try:
+                copy(src, dest)
+            except Exception as e:
+                self.root.after(0, self._finish_install, mod_data, e)
+            else:
+                self.root.after(0, self._finish_install, mod_data, None)
+        
+        # Not a daemon, so an interrupted app still finishes the copy it started
+        threading.Thread(target=do_copy).start()
+    
+    def _finish_install(self, mod_data: Dict[str, Any], error):
+        """Add a copied mod to the list, or report why the copy failed"""
+        self._installing = False
+        self._invalidate_dir_cache(self.mods_folder)
+        if error is not None:
+            self.status_var.set("Ready")
+            messagebox.showerror("Error", f"Failed to install mod: {str(error)}")
+            return
+        
+        mod_data['id'] = len(self.mods_data)
+        mod_data['priority'] = len(self.mods_data)
+        self.mods_data.append(mod_data)
+        self.save_mods_data()
+        
+        # Append the new row. Restarting the insert chain from the rows already
+        # in the tree also picks up any rebuild that is still in progress
+        self._rebuild_token += 1
+        self._insert_mod_rows(self._rebuild_token, list(self.mod_tree.get_children()))
+        
+        self.status_var.set(f"Mod '{mod_data['name']}' added successfully!")
     
     def remove_mod(self):
         """Remove selected mod"""
@@ -795,40 +1422,46 @@ class ModManager:
         
         item = selection[0]
         mod_name = self.mod_tree.item(item)['text']
+        mod_index = self._mod_index.get(mod_name)
+        if mod_index is None:
+            # The index is empty until a rebuild's last chunk is inserted
+            messagebox.showinfo("Please Wait", "The mod list is still loading. Try again in a moment.")
+            return
         
         # Confirm deletion
         if messagebox.askyesno("Confirm", f"Are you sure you want to remove '{mod_name}'?"):
             try:
-                # Find mod in data
-                mod_index = None
-                for i, mod in enumerate(self.mods_data):
-                    if mod['name'] == mod_name:
-                        mod_index = i
-                        break
+                mod = self.mods_data[mod_index]
+                
+                # Remove file/folder from mods directory
+                mod_path = os.path.join(self.mods_folder, mod['file_path'])
+                try:
+                    if mod['type'] == 'folder':
+                        _rmtree(mod_path)
+                    else:
+                        os.remove(mod_path)
+                except FileNotFoundError:
+                    # Already gone; just drop the entry. Anything that
+                    # vanished partway through a folder is a real failure
+                    if os.path.lexists(mod_path):
+                        raise
+                self._invalidate_dir_cache(self.mods_folder)
+                
+                # Remove from data and drop its row
+                self.mods_data.pop(mod_index)
+                items = list(self.mod_tree.get_children())
+                self.mod_tree.delete(items.pop(mod_index))
+                self._index_mods(items)
                 
-                if mod_index is not None:
-                    mod = self.mods_data[mod_index]
-                    
-                    # Remove file/folder from mods directory
-                    mod_path = os.path.join(self.mods_folder, mod['file_path'])
-                    if os.path.exists(mod_path):
-                        if mod['type'] == 'folder':
-                            shutil.rmtree(mod_path)
-                        else:
-                            os.remove(mod_path)
-                    
-                    # Remove from data
-                    self.mods_data.pop(mod_index)
-                    
-                    # Update priorities
-                    for i, remaining_mod in enumerate(self.mods_data):
-                        remaining_mod['priority'] = i
-                    
-                    self.save_mods_data()
-                    self.refresh_mod_list()
-                    
-                    self.status_var.set(f"Mod '{mod_name}' removed successfully!")
+                # Update priorities of the mods that moved up
+                for i in range(mod_index, len(self.mods_data)):
+                    self.mods_data[i]['priority'] = i
+                    self._update_mod_row(items[i], self.mods_data[i])
                 
+                self.save_mods_data()
+                
+                self.status_var.set(f"Mod '{mod_name}' removed successfully!")
+            
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to remove mod: {str(e)}")
     
@@ -843,13 +1476,14 @@ class ModManager:
         mod_name = self.mod_tree.item(item)['text']
         
         # Find and toggle mod
-        for mod in self.mods_data:
-            if mod['name'] == mod_name:
-                mod['enabled'] = not mod['enabled']
-                break
+        mod_index = self._mod_index.get(mod_name)
+        if mod_index is None:
+            return
+        mod = self.mods_data[mod_index]
+        mod['enabled'] = not mod['enabled']
         
         self.save_mods_data()
-        self.refresh_mod_list()
+        self._update_mod_row(self._mod_items[mod_name], mod)
         
         status = "enabled" if mod['enabled'] else "disabled"
         self.status_var.set(f"Mod '{mod_name}' {status}!")
@@ -872,13 +1506,7 @@ class ModManager:
         item = selection[0]
         mod_name = self.mod_tree.item(item)['text']
         
-        # Find mod index
-        mod_index = None
-        for i, mod in enumerate(self.mods_data):
-            if mod['name'] == mod_name:
-                mod_index = i
-                break
-        
+        mod_index = self._mod_index.get(mod_name)
         if mod_index is not None:
             new_index = mod_index + direction
             
@@ -888,36 +1516,79 @@ class ModManager:
                 self.mods_data[mod_index], self.mods_data[new_index] = \
                     self.mods_data[new_index], self.mods_data[mod_index]
                 
-                # Update priorities
-                for i, mod in enumerate(self.mods_data):
-                    mod['priority'] = i
+                # Update priorities; only the swapped pair changes
+                for i in (mod_index, new_index):
+                    self.mods_data[i]['priority'] = i
                 
                 self.save_mods_data()
-                self.refresh_mod_list()
+                
+                # Swap the two rows and their index entries in place
+                moved_item = self._mod_items[mod_name]
+                other_item = (self.mod_tree.prev(moved_item) if direction == -1
+                              else self.mod_tree.next(moved_item))
+                other_name = self.mods_data[mod_index]['name']
+                self.mod_tree.move(moved_item, '', new_index)
+                if other_name == mod_name:
+                    # Same name: the first occurrence is now the other row
+                    self._mod_items[mod_name] = other_item
+                else:
+                    self._mod_index[mod_name] = new_index
+                    if self._mod_index[other_name] == new_index:
+                        self._mod_index[other_name] = mod_index
+                self._update_mod_row(moved_item, self.mods_data[new_index])
+                self._update_mod_row(other_item, self.mods_data[mod_index])
                 
                 # Reselect the moved mod
-                for child in self.mod_tree.get_children():
-                    if self.mod_tree.item(child)['text'] == mod_name:
-                        self.mod_tree.selection_set(child)
-                        break
+                self.mod_tree.selection_set(self._mod_items[mod_name])
                 
                 direction_text = "up" if direction == -1 else "down"
                 self.status_var.set(f"Moved '{mod_name}' {direction_text}!")
     
-    def refresh_mod_list(self):
-        """Refresh the mod list display"""
+    def rebuild_mod_list(self):
+        """Rebuild the mod list display from scratch"""
         # Clear existing items
         for item in self.mod_tree.get_children():
             self.mod_tree.delete(item)
         
-        # Sort mods by priority
-        sorted_mods = sorted(self.mods_data, key=lambda x: x['priority'])
+        # Mods are kept in dense priority order, so no sort is needed here
+        assert all(mod['priority'] == i for i, mod in enumerate(self.mods_data))
+        
+        # Add mods to tree in chunks so the UI stays responsive. Until the
+        # index is rebuilt at the end, mod actions find nothing and do nothing
+        self._mod_index = {}
+        self._mod_items = {}
+        self._rebuild_token += 1
+        self._insert_mod_rows(self._rebuild_token, [])
+    
+    def _insert_mod_rows(self, token: int, items: List[str]):
+        """Insert the next chunk of mod rows, then yield to the event loop"""
+        if token != self._rebuild_token:
+            return  # A newer rebuild has started
         
-        # Add mods to tree
-        for mod in sorted_mods:
+        start = len(items)
+        for mod in self.mods_data[start:start + MOD_ROW_CHUNK]:
             status = "Enabled" if mod['enabled'] else "Disabled"
-            self.mod_tree.insert('', 'end', text=mod['name'], 
-                               values=(mod['file_path'], status, mod['priority']))
+            items.append(self.mod_tree.insert('', 'end', text=mod['name'], 
+                                              values=(mod['file_path'], status, mod['priority'])))
+        
+        if len(items) < len(self.mods_data):
+            self.root.after_idle(self._insert_mod_rows, token, items)
+        else:
+            self._index_mods(items)
+    
+    def _index_mods(self, items):
+        """Map mod names to their mods_data positions and tree rows"""
+        self._mod_index = {}
+        self._mod_items = {}
+        for i, (mod, item) in enumerate(zip(self.mods_data, items)):
+            # With duplicate names the first one wins, as the old scans did
+            self._mod_index.setdefault(mod['name'], i)
+            self._mod_items.setdefault(mod['name'], item)
+    
+    def _update_mod_row(self, item: str, mod: Dict[str, Any]):
+        """Redraw one mod's row after its data changed"""
+        status = "Enabled" if mod['enabled'] else "Disabled"
+        self.mod_tree.item(item, values=(mod['file_path'], status, mod['priority']))
     
     def run(self):
         """Run the application"""
@@ -933,15 +1604,13 @@ class ModManager:
             is_steam_game = False
             steam_id = None
             
-            # Check for Steam Proton paths
-            if "steamapps/compatdata/" in self.game_path:
+            # Check for Steam Proton paths, taking the Steam ID that follows
+            _, sep, rest = self.game_path.partition("steamapps/compatdata/")
+            if sep:
                 is_steam_game = True
-                # Try to extract the Steam ID from path
-                path_parts = self.game_path.split("steamapps/compatdata/")
-                if len(path_parts) > 1:
-                    steam_id_path = path_parts[1].split("/")[0]
-                    if steam_id_path.isdigit():
-                        steam_id = steam_id_path
+                steam_id_path = rest.partition("/")[0]
+                if steam_id_path.isdigit():
+                    steam_id = steam_id_path
             
             if is_steam_game and steam_id:
                 # Ask if user wants to launch through Steam
@@ -961,8 +1630,12 @@ class ModManager:
             
             # Normal launch (direct executable)
             if os.path.isdir(self.game_path):
-                # Try to find an executable in the folder
-                exes = [f for f in os.listdir(self.game_path) if f.lower().endswith(('.exe', '.AppImage', '.sh'))]
+                # Try to find an executable in the folder; DirEntry.is_file()
+                # uses the type readdir already returned, so no stat per file
+                with os.scandir(self.game_path) as it:
+                    exes = [entry.name for entry in it
+                            if os.path.splitext(entry.name)[1].lower() in EXE_EXTENSIONS
+                            and entry.is_file()]
                 if not exes:
                     messagebox.showerror("Error", "No executable found in the selected folder!")
                     return
@@ -982,8 +1655,9 @@ class ModManager:
             if os.name == 'posix':
                 try:
                     current_mode = os.stat(exe_path).st_mode
-                    os.chmod(exe_path, current_mode | 0o111)  # Add executable permission
-                except Exception:
+                    if current_mode & 0o111 != 0o111:  # Usually already executable
+                        os.chmod(exe_path, current_mode | 0o111)  # Add executable permission
+                except OSError:
                     pass  # If this fails, we'll try anyway
             
             # Launch the executable
@@ -998,7 +1672,7 @@ class ModManager:
         # Create a simple dialog for selection
         select_window = tk.Toplevel(self.root)
         select_window.title("Select Executable")
-        select_window.geometry("400x300")
+        self._center_toplevel(select_window, 400, 300)
         select_window.transient(self.root)
         select_window.grab_set()
         
@@ -1036,14 +1710,6 @@ class ModManager:
         tk.Button(btn_frame, text="OK", command=on_ok).pack(side=tk.RIGHT, padx=10)
         tk.Button(btn_frame, text="Cancel", command=on_cancel).pack(side=tk.RIGHT)
         
-        # Center the window
-        select_window.update_idletasks()
-        width = select_window.winfo_width()
-        height = select_window.winfo_height()
-        x = (select_window.winfo_screenwidth() // 2) - (width // 2)
-        y = (select_window.winfo_screenheight() // 2) - (height // 2)
-        select_window.geometry(f"{width}x{height}+{x}+{y}")
-        
         # Wait for the window to be closed
         self.root.wait_window(select_window)
         